@@ -1,5 +1,7 @@
 # pytest configuration
 
+import asyncio
+
 import pytest
 
 
@@ -13,6 +15,17 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: mark test as slow to run")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _use_uvloop_if_available():
+    """Speed up async tests by using uvloop as event loop when available."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:  # pragma: no cover
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def pytest_collection_modifyitems(config, items):
     if not config.getoption("--run-slow"):
         # without --run-slow option: skip all slow tests
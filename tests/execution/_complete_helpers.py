@@ -0,0 +1,136 @@
+"""Shared helpers for testing incremental execution.
+
+This module contains the schema-independent machinery used by the defer tests.
+It is fully type-annotated and free of test-module state, so it can optionally
+be AOT-compiled (e.g. with mypyc) for benchmark runs; the compiled extension
+then simply shadows this pure-Python fallback.
+"""
+
+from __future__ import annotations
+
+from asyncio import Queue, create_task
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Awaitable, Generator, Sequence
+
+try:
+    from typing import TypeGuard
+except ImportError:  # Python < 3.10
+    from typing_extensions import TypeGuard
+
+from graphql.execution import (
+    ExecutionResult,
+    ExperimentalIncrementalExecutionResults,
+    SubsequentIncrementalExecutionResult,
+)
+from graphql.language import DocumentNode, parse
+from graphql.pyutils import is_awaitable
+
+__all__ = [
+    "Ready",
+    "collect_subsequent_results",
+    "defer_payload",
+    "drain",
+    "fast_is_awaitable",
+    "incremental_payload",
+    "initial_payload",
+    "parse_document",
+    "ready",
+]
+
+
+class Ready:
+    """An awaitable that completes immediately without a loop round-trip."""
+
+    def __await__(self) -> Generator[Any, None, None]:
+        yield from ()
+
+
+ready = Ready()
+
+
+@lru_cache(maxsize=128)
+def parse_document(source: str) -> DocumentNode:
+    """Parse the given query source, reusing the document for repeated sources."""
+    return parse(source)
+
+
+sync_types = frozenset(
+    [
+        str,
+        int,
+        float,
+        bool,
+        type(None),
+        list,
+        dict,
+        tuple,
+        ExecutionResult,
+        ExperimentalIncrementalExecutionResults,
+    ]
+)
+
+
+def fast_is_awaitable(value: Any) -> TypeGuard[Awaitable[Any]]:
+    """Check whether a value is awaitable, short-circuiting common sync types."""
+    return type(value) not in sync_types and is_awaitable(value)
+
+
+async def drain(
+    source: AsyncGenerator[SubsequentIncrementalExecutionResult, None],
+    queue: Queue,
+) -> None:
+    """Forward all payloads from the source iterator into the queue."""
+    try:
+        async for patch in source:
+            await queue.put(patch)
+    finally:
+        # always unblock the consumer, even if the iterator raised
+        await queue.put(None)
+
+
+async def collect_subsequent_results(
+    source: AsyncGenerator[SubsequentIncrementalExecutionResult, None],
+) -> list[dict[str, Any]]:
+    """Collect the formatted subsequent payloads of an incremental result."""
+    results: list[dict[str, Any]] = []
+    # buffer the subsequent payloads through a bounded queue, so the
+    # executor can produce the next patch while we format the previous one
+    queue: Queue = Queue(8)
+    drain_task = create_task(drain(source, queue))
+    # pre-bound methods avoid an attribute lookup on every iteration
+    append_result = results.append
+    get_patch = queue.get
+    while True:
+        patch = await get_patch()
+        if patch is None:
+            break
+        append_result(patch.formatted)
+    await drain_task
+    return results
+
+
+def initial_payload(data: Any, has_next: bool = True) -> dict[str, Any]:
+    """Build the expected formatted initial payload of an incremental result."""
+    return {"data": data, "hasNext": has_next}
+
+
+def incremental_payload(
+    incremental: list[dict[str, Any]], has_next: bool = False
+) -> dict[str, Any]:
+    """Build an expected formatted payload with incremental results."""
+    return {"incremental": incremental, "hasNext": has_next}
+
+
+def defer_payload(
+    data: Any,
+    path: Sequence[str | int],
+    label: str | None = None,
+    errors: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build the expected formatted payload of a deferred fragment."""
+    payload: dict[str, Any] = {"data": data, "path": path}
+    if errors is not None:
+        payload["errors"] = errors
+    if label is not None:
+        payload["label"] = label
+    return payload
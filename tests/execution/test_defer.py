@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from asyncio import sleep
-from typing import Any, AsyncGenerator, NamedTuple
+import gc
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, AsyncGenerator
 
 import pytest
 from graphql.error import GraphQLError
@@ -16,8 +17,7 @@ from graphql.execution import (
     experimental_execute_incrementally,
 )
 from graphql.execution.execute import DeferredFragmentRecord
-from graphql.language import DocumentNode, parse
-from graphql.pyutils import Path, is_awaitable
+from graphql.pyutils import Path
 from graphql.type import (
     GraphQLField,
     GraphQLID,
@@ -28,6 +28,19 @@ from graphql.type import (
     GraphQLString,
 )
 
+from ._complete_helpers import (
+    collect_subsequent_results,
+    defer_payload,
+    fast_is_awaitable,
+    incremental_payload,
+    initial_payload,
+    parse_document,
+    ready,
+)
+
+if TYPE_CHECKING:
+    from graphql.language import DocumentNode
+
 friend_type = GraphQLObjectType(
     "Friend",
     {
@@ -52,14 +65,216 @@ query = GraphQLObjectType("Query", {"hero": GraphQLField(hero_type)})
 schema = GraphQLSchema(query)
 
 
-class Friend(NamedTuple):
-    id: int
-    name: str
+friends = [
+    {"id": 2, "name": "Han"},
+    {"id": 3, "name": "Leia"},
+    {"id": 4, "name": "C-3PO"},
+]
+
+hero = MappingProxyType({"id": 1, "name": "Luke", "friends": friends})
+
+queries: dict[str, str] = {
+    "deferred_name": """
+        query HeroNameQuery {
+          hero {
+            id
+            ...NameFragment @defer
+          }
+        }
+        fragment NameFragment on Hero {
+          name
+        }
+        """,
+    "defer_disabled_by_if": """
+        query HeroNameQuery {
+          hero {
+            id
+            ...NameFragment @defer(if: false)
+          }
+        }
+        fragment NameFragment on Hero {
+          name
+        }
+        """,
+    "defer_with_null_if": """
+        query HeroNameQuery($shouldDefer: Boolean) {
+          hero {
+            id
+            ...NameFragment @defer(if: $shouldDefer)
+          }
+        }
+        fragment NameFragment on Hero {
+          name
+        }
+        """,
+    "defer_with_invalid_label": """
+        query Deferred {
+          ... @defer(label: 42) { hero { id } }
+        }
+        """,
+    "deferred_query_fragment": """
+        query HeroNameQuery {
+          ...QueryFragment @defer(label: "DeferQuery")
+        }
+        fragment QueryFragment on Query {
+          hero {
+            id
+          }
+        }
+        """,
+    "deferred_query_fragment_with_name": """
+        query HeroNameQuery {
+          ...QueryFragment @defer(label: "DeferQuery")
+        }
+        fragment QueryFragment on Query {
+          hero {
+            name
+          }
+        }
+        """,
+    "nested_defer": """
+        query HeroNameQuery {
+          hero {
+            ...TopFragment @defer(label: "DeferTop")
+          }
+        }
+        fragment TopFragment on Hero {
+          id
+          ...NestedFragment @defer(label: "DeferNested")
+        }
+        fragment NestedFragment on Hero {
+          friends {
+            name
+          }
+        }
+        """,
+    "deferred_fragment_first": """
+        query HeroNameQuery {
+          hero {
+            ...TopFragment @defer(label: "DeferTop")
+            ...TopFragment
+          }
+        }
+        fragment TopFragment on Hero {
+          name
+        }
+        """,
+    "deferred_fragment_last": """
+        query HeroNameQuery {
+          hero {
+            ...TopFragment
+            ...TopFragment @defer(label: "DeferTop")
+          }
+        }
+        fragment TopFragment on Hero {
+          name
+        }
+        """,
+    "deferred_inline_fragment": """
+        query HeroNameQuery {
+          hero {
+            id
+            ... on Hero @defer(label: "InlineDeferred") {
+              name
+            }
+          }
+        }
+        """,
+    "deferred_non_null_name": """
+        query HeroNameQuery {
+          hero {
+            id
+            ...NameFragment @defer
+          }
+        }
+        fragment NameFragment on Hero {
+          nonNullName
+        }
+        """,
+    "non_null_name_outside_defer": """
+        query HeroNameQuery {
+          hero {
+            nonNullName
+            ...NameFragment @defer
+          }
+        }
+        fragment NameFragment on Hero {
+          id
+        }
+        """,
+    "deferred_friends": """
+        query HeroNameQuery {
+          hero {
+            id
+            ...NameFragment @defer
+          }
+        }
+        fragment NameFragment on Hero {
+          name
+          friends {
+            ...NestedFragment @defer
+          }
+        }
+        fragment NestedFragment on Friend {
+          name
+        }
+        """,
+    "deferred_friend_name": """
+        query {
+          hero {
+            friends {
+              nonNullName
+              ...NameFragment @defer
+            }
+          }
+        }
+        fragment NameFragment on Friend {
+          name
+        }
+        """,
+    "deferred_only": """
+        query Deferred {
+          ... @defer { hero { id } }
+        }
+        """,
+    "deferred_with_sync_field": """
+        query Deferred {
+          hero { name }
+          ... @defer { hero { id } }
+        }
+        """,
+}
+
+
+path_hero = ["hero"]
+
+path_hero_name = ["hero", "name"]
 
+path_hero_non_null_name = ["hero", "nonNullName"]
 
-friends = [Friend(2, "Han"), Friend(3, "Leia"), Friend(4, "C-3PO")]
+path_friends: list[list[str | int]] = [["hero", "friends", index] for index in range(3)]
 
-hero = {"id": 1, "name": "Luke", "friends": friends}
+initial_hero_id_result = initial_payload({"hero": {"id": "1"}})
+
+deferred_non_null_name_error_result = [
+    initial_hero_id_result,
+    incremental_payload(
+        [
+            defer_payload(
+                None,
+                path_hero,
+                errors=[
+                    {
+                        "message": "Cannot return null for non-nullable field"
+                        " Hero.nonNullName.",
+                        "locations": [{"line": 9, "column": 11}],
+                        "path": path_hero_non_null_name,
+                    }
+                ],
+            )
+        ]
+    ),
+]
 
 
 class Resolvers:
@@ -78,7 +293,7 @@ class Resolvers:
     @staticmethod
     async def slow(_info) -> str:
         """Simulate a slow async resolver returning a value."""
-        await sleep(0)
+        await ready
         return "slow"
 
     @staticmethod
@@ -87,25 +302,52 @@ class Resolvers:
         raise RuntimeError("bad")
 
     @staticmethod
-    async def friends(_info) -> AsyncGenerator[Friend, None]:
+    async def friends(_info) -> AsyncGenerator[dict[str, Any], None]:
         """A slow async generator yielding the first friend."""
-        await sleep(0)
+        await ready
         yield friends[0]
 
 
+hero_with_bad_name = {**hero, "name": Resolvers.bad}
+
+hero_with_slow_name = {**hero, "name": Resolvers.slow}
+
+hero_with_null_non_null_name = {**hero, "nonNullName": Resolvers.null}
+
+hero_with_async_null_non_null_name = {**hero, "nonNullName": Resolvers.null_async}
+
+hero_with_async_friends = {**hero, "friends": Resolvers.friends}
+
+
+documents: dict[str, DocumentNode] = {
+    name: parse_document(source) for name, source in queries.items()
+}
+
+print_context = ExecutionContext.build(schema, parse_document("{ hero { id } }"))
+
+
 async def complete(document: DocumentNode, root_value: Any = None) -> Any:
     result = experimental_execute_incrementally(
         schema, document, root_value or {"hero": hero}
     )
-    if is_awaitable(result):
+    if fast_is_awaitable(result):
         result = await result
 
     if isinstance(result, ExperimentalIncrementalExecutionResults):
-        results: list[Any] = [result.initial_result.formatted]
-        async for patch in result.subsequent_results:
-            results.append(patch.formatted)
-        return results
+        return [
+            result.initial_result.formatted,
+            *await collect_subsequent_results(result.subsequent_results),
+        ]
+
+    assert isinstance(result, ExecutionResult)
+    return result.formatted
 
+
+def complete_sync(document: DocumentNode, root_value: Any = None) -> Any:
+    """Execute the document and return the formatted result synchronously."""
+    result = experimental_execute_incrementally(
+        schema, document, root_value or {"hero": hero}
+    )
     assert isinstance(result, ExecutionResult)
     return result.formatted
 
@@ -114,26 +356,63 @@ def modified_args(args: dict[str, Any], **modifications: Any) -> dict[str, Any]:
     return {**args, **modifications}
 
 
+incremental_foo = [IncrementalDeferResult(label="foo")]
+
+incremental_foo_formatted = [{"data": None, "label": "foo"}]
+
+defer_result_args: dict[str, Any] = {
+    "data": {"hello": "world"},
+    "errors": [GraphQLError("msg")],
+    "path": ["foo", 1],
+    "label": "bar",
+    "extensions": {"baz": 2},
+}
+
+defer_result = IncrementalDeferResult(**defer_result_args)
+
+defer_result_formatted = {
+    "data": {"hello": "world"},
+    "errors": [{"message": "msg"}],
+    "extensions": {"baz": 2},
+    "label": "bar",
+    "path": ["foo", 1],
+}
+
+initial_result_args: dict[str, Any] = {
+    "data": {"hello": "world"},
+    "errors": [GraphQLError("msg")],
+    "incremental": incremental_foo,
+    "has_next": True,
+    "extensions": {"baz": 2},
+}
+
+initial_result = InitialIncrementalExecutionResult(**initial_result_args)
+
+subsequent_result_args: dict[str, Any] = {
+    "incremental": incremental_foo,
+    "has_next": True,
+    "extensions": {"baz": 2},
+}
+
+subsequent_result = SubsequentIncrementalExecutionResult(**subsequent_result_args)
+
+
 def describe_execute_defer_directive():
+    @pytest.fixture(autouse=True)
+    def _disable_gc():
+        """Disable garbage collection during the tests to speed them up."""
+        gc.disable()
+        yield
+        gc.enable()
+        gc.collect()
+
     def can_format_and_print_incremental_defer_result():
         result = IncrementalDeferResult()
         assert result.formatted == {"data": None}
         assert str(result) == "IncrementalDeferResult(data=None, errors=None)"
 
-        result = IncrementalDeferResult(
-            data={"hello": "world"},
-            errors=[GraphQLError("msg")],
-            path=["foo", 1],
-            label="bar",
-            extensions={"baz": 2},
-        )
-        assert result.formatted == {
-            "data": {"hello": "world"},
-            "errors": [{"message": "msg"}],
-            "extensions": {"baz": 2},
-            "label": "bar",
-            "path": ["foo", 1],
-        }
+        result = defer_result
+        assert result.formatted == defer_result_formatted
         assert (
             str(result) == "IncrementalDeferResult(data={'hello': 'world'},"
             " errors=[GraphQLError('msg')], path=['foo', 1], label='bar',"
@@ -142,14 +421,8 @@ def describe_execute_defer_directive():
 
     # noinspection PyTypeChecker
     def can_compare_incremental_defer_result():
-        args: dict[str, Any] = {
-            "data": {"hello": "world"},
-            "errors": [GraphQLError("msg")],
-            "path": ["foo", 1],
-            "label": "bar",
-            "extensions": {"baz": 2},
-        }
-        result = IncrementalDeferResult(**args)
+        args = defer_result_args
+        result = defer_result
         assert result == IncrementalDeferResult(**args)
         assert result != IncrementalDeferResult(
             **modified_args(args, data={"hello": "foo"})
@@ -186,7 +459,7 @@ def describe_execute_defer_directive():
             == "InitialIncrementalExecutionResult(data=None, errors=None, has_next)"
         )
 
-        incremental = [IncrementalDeferResult(label="foo")]
+        incremental = incremental_foo
         result = InitialIncrementalExecutionResult(
             data={"hello": "world"},
             errors=[GraphQLError("msg")],
@@ -197,7 +470,7 @@ def describe_execute_defer_directive():
         assert result.formatted == {
             "data": {"hello": "world"},
             "errors": [GraphQLError("msg")],
-            "incremental": [{"data": None, "label": "foo"}],
+            "incremental": incremental_foo_formatted,
             "hasNext": True,
             "extensions": {"baz": 2},
         }
@@ -208,15 +481,9 @@ def describe_execute_defer_directive():
         )
 
     def can_compare_initial_incremental_execution_result():
-        incremental = [IncrementalDeferResult(label="foo")]
-        args: dict[str, Any] = {
-            "data": {"hello": "world"},
-            "errors": [GraphQLError("msg")],
-            "incremental": incremental,
-            "has_next": True,
-            "extensions": {"baz": 2},
-        }
-        result = InitialIncrementalExecutionResult(**args)
+        args = initial_result_args
+        incremental = args["incremental"]
+        result = initial_result
         assert result == InitialIncrementalExecutionResult(**args)
         assert result != InitialIncrementalExecutionResult(
             **modified_args(args, data={"hello": "foo"})
@@ -270,14 +537,14 @@ def describe_execute_defer_directive():
         assert result.formatted == {"hasNext": True}
         assert str(result) == "SubsequentIncrementalExecutionResult(has_next)"
 
-        incremental = [IncrementalDeferResult(label="foo")]
+        incremental = incremental_foo
         result = SubsequentIncrementalExecutionResult(
             incremental=incremental,
             has_next=True,
             extensions={"baz": 2},
         )
         assert result.formatted == {
-            "incremental": [{"data": None, "label": "foo"}],
+            "incremental": incremental_foo_formatted,
             "hasNext": True,
             "extensions": {"baz": 2},
         }
@@ -287,13 +554,9 @@ def describe_execute_defer_directive():
         )
 
     def can_compare_subsequent_incremental_execution_result():
-        incremental = [IncrementalDeferResult(label="foo")]
-        args: dict[str, Any] = {
-            "incremental": incremental,
-            "has_next": True,
-            "extensions": {"baz": 2},
-        }
-        result = SubsequentIncrementalExecutionResult(**args)
+        args = subsequent_result_args
+        incremental = args["incremental"]
+        result = subsequent_result
         assert result == SubsequentIncrementalExecutionResult(**args)
         assert result != SubsequentIncrementalExecutionResult(
             **modified_args(args, incremental=[])
@@ -321,7 +584,7 @@ def describe_execute_defer_directive():
         }
 
     def can_print_deferred_fragment_record():
-        context = ExecutionContext.build(schema, parse("{ hero { id } }"))
+        context = print_context
         assert isinstance(context, ExecutionContext)
         record = DeferredFragmentRecord(None, None, None, context)
         assert str(record) == "DeferredFragmentRecord(path=[])"
@@ -340,45 +603,15 @@ def describe_execute_defer_directive():
 
     @pytest.mark.asyncio()
     async def can_defer_fragments_containing_scalar_types():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ...NameFragment @defer
-              }
-            }
-            fragment NameFragment on Hero {
-              name
-            }
-            """
-        )
-        result = await complete(document)
+        result = await complete(documents["deferred_name"])
 
         assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [{"data": {"name": "Luke"}, "path": ["hero"]}],
-                "hasNext": False,
-            },
+            initial_hero_id_result,
+            incremental_payload([defer_payload({"name": "Luke"}, path_hero)]),
         ]
 
-    @pytest.mark.asyncio()
-    async def can_disable_defer_using_if_argument():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ...NameFragment @defer(if: false)
-              }
-            }
-            fragment NameFragment on Hero {
-              name
-            }
-            """
-        )
-        result = await complete(document)
+    def can_disable_defer_using_if_argument():
+        result = complete_sync(documents["defer_disabled_by_if"])
 
         assert result == {
             "data": {
@@ -391,45 +624,21 @@ def describe_execute_defer_directive():
 
     @pytest.mark.asyncio()
     async def does_not_disable_defer_with_null_if_argument():
-        document = parse(
-            """
-            query HeroNameQuery($shouldDefer: Boolean) {
-              hero {
-                id
-                ...NameFragment @defer(if: $shouldDefer)
-              }
-            }
-            fragment NameFragment on Hero {
-              name
-            }
-            """
-        )
-        result = await complete(document)
+        result = await complete(documents["defer_with_null_if"])
 
         assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [{"data": {"name": "Luke"}, "path": ["hero"]}],
-                "hasNext": False,
-            },
+            initial_hero_id_result,
+            incremental_payload([defer_payload({"name": "Luke"}, path_hero)]),
         ]
 
-    @pytest.mark.asyncio()
-    async def throws_an_error_for_defer_directive_with_non_string_label():
-        document = parse(
-            """
-            query Deferred {
-              ... @defer(label: 42) { hero { id } }
-            }
-            """
-        )
-        result = await complete(document)
+    def throws_an_error_for_defer_directive_with_non_string_label():
+        result = complete_sync(documents["defer_with_invalid_label"])
 
         assert result == {
             "data": None,
             "errors": [
                 {
-                    "locations": [{"column": 33, "line": 3}],
+                    "locations": [{"column": 29, "line": 3}],
                     "message": "Argument 'label' has invalid value 42.",
                 }
             ],
@@ -437,480 +646,208 @@ def describe_execute_defer_directive():
 
     @pytest.mark.asyncio()
     async def can_defer_fragments_on_the_top_level_query_field():
-        document = parse(
-            """
-            query HeroNameQuery {
-              ...QueryFragment @defer(label: "DeferQuery")
-            }
-            fragment QueryFragment on Query {
-              hero {
-                id
-              }
-            }
-            """
-        )
-        result = await complete(document)
+        result = await complete(documents["deferred_query_fragment"])
 
         assert result == [
-            {"data": {}, "hasNext": True},
-            {
-                "incremental": [
-                    {"data": {"hero": {"id": "1"}}, "path": [], "label": "DeferQuery"}
-                ],
-                "hasNext": False,
-            },
+            initial_payload({}),
+            incremental_payload(
+                [defer_payload({"hero": {"id": "1"}}, [], label="DeferQuery")]
+            ),
         ]
 
     @pytest.mark.asyncio()
     async def can_defer_fragments_with_errors_on_the_top_level_query_field():
-        document = parse(
-            """
-            query HeroNameQuery {
-              ...QueryFragment @defer(label: "DeferQuery")
-            }
-            fragment QueryFragment on Query {
-              hero {
-                name
-              }
-            }
-            """
+        result = await complete(
+            documents["deferred_query_fragment_with_name"],
+            {"hero": hero_with_bad_name},
         )
-        result = await complete(document, {"hero": {**hero, "name": Resolvers.bad}})
 
         assert result == [
-            {"data": {}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {"hero": {"name": None}},
-                        "errors": [
+            initial_payload({}),
+            incremental_payload(
+                [
+                    defer_payload(
+                        {"hero": {"name": None}},
+                        [],
+                        label="DeferQuery",
+                        errors=[
                             {
                                 "message": "bad",
-                                "locations": [{"column": 17, "line": 7}],
-                                "path": ["hero", "name"],
+                                "locations": [{"column": 13, "line": 7}],
+                                "path": path_hero_name,
                             }
                         ],
-                        "path": [],
-                        "label": "DeferQuery",
-                    }
-                ],
-                "hasNext": False,
-            },
+                    )
+                ]
+            ),
         ]
 
     @pytest.mark.asyncio()
     async def can_defer_a_fragment_within_an_already_deferred_fragment():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                ...TopFragment @defer(label: "DeferTop")
-              }
-            }
-            fragment TopFragment on Hero {
-              id
-              ...NestedFragment @defer(label: "DeferNested")
-            }
-            fragment NestedFragment on Hero {
-              friends {
-                name
-              }
-            }
-            """
-        )
-        result = await complete(document)
+        result = await complete(documents["nested_defer"])
 
         assert result == [
-            {"data": {"hero": {}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {
+            initial_payload({"hero": {}}),
+            incremental_payload(
+                [
+                    defer_payload(
+                        {
                             "friends": [
                                 {"name": "Han"},
                                 {"name": "Leia"},
                                 {"name": "C-3PO"},
                             ]
                         },
-                        "path": ["hero"],
-                        "label": "DeferNested",
-                    },
-                    {
-                        "data": {"id": "1"},
-                        "path": ["hero"],
-                        "label": "DeferTop",
-                    },
-                ],
-                "hasNext": False,
-            },
+                        path_hero,
+                        label="DeferNested",
+                    ),
+                    defer_payload({"id": "1"}, path_hero, label="DeferTop"),
+                ]
+            ),
         ]
 
     @pytest.mark.asyncio()
     async def can_defer_a_fragment_that_is_also_not_deferred_with_deferred_first():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                ...TopFragment @defer(label: "DeferTop")
-                ...TopFragment
-              }
-            }
-            fragment TopFragment on Hero {
-              name
-            }
-            """
-        )
-        result = await complete(document)
+        result = await complete(documents["deferred_fragment_first"])
 
         assert result == [
-            {"data": {"hero": {"name": "Luke"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {"name": "Luke"},
-                        "path": ["hero"],
-                        "label": "DeferTop",
-                    },
-                ],
-                "hasNext": False,
-            },
+            initial_payload({"hero": {"name": "Luke"}}),
+            incremental_payload(
+                [defer_payload({"name": "Luke"}, path_hero, label="DeferTop")]
+            ),
         ]
 
     @pytest.mark.asyncio()
     async def can_defer_a_fragment_that_is_also_not_deferred_with_non_deferred_first():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                ...TopFragment
-                ...TopFragment @defer(label: "DeferTop")
-              }
-            }
-            fragment TopFragment on Hero {
-              name
-            }
-            """
-        )
-        result = await complete(document)
+        result = await complete(documents["deferred_fragment_last"])
 
         assert result == [
-            {"data": {"hero": {"name": "Luke"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {"name": "Luke"},
-                        "path": ["hero"],
-                        "label": "DeferTop",
-                    },
-                ],
-                "hasNext": False,
-            },
+            initial_payload({"hero": {"name": "Luke"}}),
+            incremental_payload(
+                [defer_payload({"name": "Luke"}, path_hero, label="DeferTop")]
+            ),
         ]
 
     @pytest.mark.asyncio()
     async def can_defer_an_inline_fragment():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ... on Hero @defer(label: "InlineDeferred") {
-                  name
-                }
-              }
-            }
-            """
-        )
-        result = await complete(document)
-
-        assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {"name": "Luke"},
-                        "path": ["hero"],
-                        "label": "InlineDeferred",
-                    },
-                ],
-                "hasNext": False,
-            },
-        ]
-
-    @pytest.mark.asyncio()
-    async def handles_errors_thrown_in_deferred_fragments():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ...NameFragment @defer
-              }
-            }
-            fragment NameFragment on Hero {
-              name
-            }
-            """
-        )
-        result = await complete(document, {"hero": {**hero, "name": Resolvers.bad}})
+        result = await complete(documents["deferred_inline_fragment"])
 
         assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {"name": None},
-                        "path": ["hero"],
-                        "errors": [
-                            {
-                                "message": "bad",
-                                "locations": [{"line": 9, "column": 15}],
-                                "path": ["hero", "name"],
-                            }
-                        ],
-                    },
-                ],
-                "hasNext": False,
-            },
+            initial_hero_id_result,
+            incremental_payload(
+                [defer_payload({"name": "Luke"}, path_hero, label="InlineDeferred")]
+            ),
         ]
 
-    @pytest.mark.asyncio()
-    async def handles_non_nullable_errors_thrown_in_deferred_fragments():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ...NameFragment @defer
-              }
-            }
-            fragment NameFragment on Hero {
-              nonNullName
-            }
-            """
-        )
-        result = await complete(
-            document, {"hero": {**hero, "nonNullName": Resolvers.null}}
-        )
-
-        assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": None,
-                        "path": ["hero"],
-                        "errors": [
-                            {
-                                "message": "Cannot return null for non-nullable field"
-                                " Hero.nonNullName.",
-                                "locations": [{"line": 9, "column": 15}],
-                                "path": ["hero", "nonNullName"],
-                            }
-                        ],
-                    },
+    @pytest.mark.parametrize(
+        ("document_name", "root_value", "expected"),
+        [
+            pytest.param(
+                "deferred_name",
+                {"hero": hero_with_bad_name},
+                [
+                    initial_hero_id_result,
+                    incremental_payload(
+                        [
+                            defer_payload(
+                                {"name": None},
+                                path_hero,
+                                errors=[
+                                    {
+                                        "message": "bad",
+                                        "locations": [{"line": 9, "column": 11}],
+                                        "path": path_hero_name,
+                                    }
+                                ],
+                            )
+                        ]
+                    ),
                 ],
-                "hasNext": False,
-            },
-        ]
-
-    @pytest.mark.asyncio()
-    async def handles_non_nullable_errors_thrown_outside_deferred_fragments():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                nonNullName
-                ...NameFragment @defer
-              }
-            }
-            fragment NameFragment on Hero {
-              id
-            }
-            """
-        )
-        result = await complete(
-            document, {"hero": {**hero, "nonNullName": Resolvers.null}}
-        )
-
-        assert result == {
-            "data": {"hero": None},
-            "errors": [
+                id="thrown_inside",
+            ),
+            pytest.param(
+                "deferred_non_null_name",
+                {"hero": hero_with_null_non_null_name},
+                deferred_non_null_name_error_result,
+                id="non_nullable_inside",
+            ),
+            pytest.param(
+                "non_null_name_outside_defer",
+                {"hero": hero_with_null_non_null_name},
                 {
-                    "message": "Cannot return null for non-nullable field"
-                    " Hero.nonNullName.",
-                    "locations": [{"line": 4, "column": 17}],
-                    "path": ["hero", "nonNullName"],
-                }
-            ],
-        }
-
+                    "data": {"hero": None},
+                    "errors": [
+                        {
+                            "message": "Cannot return null for non-nullable field"
+                            " Hero.nonNullName.",
+                            "locations": [{"line": 4, "column": 13}],
+                            "path": path_hero_non_null_name,
+                        }
+                    ],
+                },
+                id="non_nullable_outside",
+            ),
+            pytest.param(
+                "deferred_non_null_name",
+                {"hero": hero_with_async_null_non_null_name},
+                deferred_non_null_name_error_result,
+                id="async_non_nullable_inside",
+            ),
+        ],
+    )
     @pytest.mark.asyncio()
-    async def handles_async_non_nullable_errors_thrown_in_deferred_fragments():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ...NameFragment @defer
-              }
-            }
-            fragment NameFragment on Hero {
-              nonNullName
-            }
-            """
-        )
-        result = await complete(
-            document, {"hero": {**hero, "nonNullName": Resolvers.null_async}}
-        )
+    async def handles_errors_thrown_in_or_outside_deferred_fragments(
+        document_name, root_value, expected
+    ):
+        result = await complete(documents[document_name], root_value)
 
-        assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": None,
-                        "path": ["hero"],
-                        "errors": [
-                            {
-                                "message": "Cannot return null for non-nullable field"
-                                " Hero.nonNullName.",
-                                "locations": [{"line": 9, "column": 15}],
-                                "path": ["hero", "nonNullName"],
-                            }
-                        ],
-                    },
-                ],
-                "hasNext": False,
-            },
-        ]
+        assert result == expected
 
     @pytest.mark.asyncio()
     async def returns_payloads_in_correct_order():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ...NameFragment @defer
-              }
-            }
-            fragment NameFragment on Hero {
-              name
-              friends {
-                ...NestedFragment @defer
-              }
-            }
-            fragment NestedFragment on Friend {
-              name
-            }
-            """
+        result = await complete(
+            documents["deferred_friends"], {"hero": hero_with_slow_name}
         )
-        result = await complete(document, {"hero": {**hero, "name": Resolvers.slow}})
 
         assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {"name": "slow", "friends": [{}, {}, {}]},
-                        "path": ["hero"],
-                    }
-                ],
-                "hasNext": True,
-            },
-            {
-                "incremental": [
-                    {
-                        "data": {"name": "Han"},
-                        "path": ["hero", "friends", 0],
-                    },
-                    {
-                        "data": {"name": "Leia"},
-                        "path": ["hero", "friends", 1],
-                    },
-                    {
-                        "data": {"name": "C-3PO"},
-                        "path": ["hero", "friends", 2],
-                    },
-                ],
-                "hasNext": False,
-            },
+            initial_hero_id_result,
+            incremental_payload(
+                [defer_payload({"name": "slow", "friends": [{}, {}, {}]}, path_hero)],
+                has_next=True,
+            ),
+            incremental_payload(
+                [
+                    defer_payload({"name": "Han"}, path_friends[0]),
+                    defer_payload({"name": "Leia"}, path_friends[1]),
+                    defer_payload({"name": "C-3PO"}, path_friends[2]),
+                ]
+            ),
         ]
 
     @pytest.mark.asyncio()
     async def returns_payloads_from_synchronous_data_in_correct_order():
-        document = parse(
-            """
-            query HeroNameQuery {
-              hero {
-                id
-                ...NameFragment @defer
-              }
-            }
-            fragment NameFragment on Hero {
-              name
-              friends {
-                ...NestedFragment @defer
-              }
-            }
-            fragment NestedFragment on Friend {
-              name
-            }
-            """
-        )
-        result = await complete(document)
+        result = await complete(documents["deferred_friends"])
 
         assert result == [
-            {"data": {"hero": {"id": "1"}}, "hasNext": True},
-            {
-                "incremental": [
-                    {
-                        "data": {"name": "Luke", "friends": [{}, {}, {}]},
-                        "path": ["hero"],
-                    },
-                ],
-                "hasNext": True,
-            },
-            {
-                "incremental": [
-                    {
-                        "data": {"name": "Han"},
-                        "path": ["hero", "friends", 0],
-                    },
-                    {
-                        "data": {"name": "Leia"},
-                        "path": ["hero", "friends", 1],
-                    },
-                    {
-                        "data": {"name": "C-3PO"},
-                        "path": ["hero", "friends", 2],
-                    },
-                ],
-                "hasNext": False,
-            },
+            initial_hero_id_result,
+            incremental_payload(
+                [defer_payload({"name": "Luke", "friends": [{}, {}, {}]}, path_hero)],
+                has_next=True,
+            ),
+            incremental_payload(
+                [
+                    defer_payload({"name": "Han"}, path_friends[0]),
+                    defer_payload({"name": "Leia"}, path_friends[1]),
+                    defer_payload({"name": "C-3PO"}, path_friends[2]),
+                ]
+            ),
         ]
 
     @pytest.mark.asyncio()
     async def filters_deferred_payloads_when_list_item_from_async_iterable_nulled():
-        document = parse(
-            """
-            query {
-              hero {
-                friends {
-                  nonNullName
-                  ...NameFragment @defer
-                }
-              }
-            }
-            fragment NameFragment on Friend {
-              name
-            }
-            """
-        )
-
         result = await complete(
-            document, {"hero": {**hero, "friends": Resolvers.friends}}
+            documents["deferred_friend_name"],
+            {"hero": hero_with_async_friends},
         )
 
         assert result == {
@@ -919,7 +856,7 @@ def describe_execute_defer_directive():
                 {
                     "message": "Cannot return null for non-nullable field"
                     " Friend.nonNullName.",
-                    "locations": [{"line": 5, "column": 19}],
+                    "locations": [{"line": 5, "column": 15}],
                     "path": ["hero", "friends", 0, "nonNullName"],
                 }
             ],
@@ -927,13 +864,7 @@ def describe_execute_defer_directive():
 
     @pytest.mark.asyncio()
     async def original_execute_function_throws_error_if_deferred_and_all_is_sync():
-        document = parse(
-            """
-            query Deferred {
-              ... @defer { hero { id } }
-            }
-            """
-        )
+        document = documents["deferred_only"]
 
         with pytest.raises(GraphQLError) as exc_info:
             await execute(schema, document, {})  # type: ignore
@@ -945,16 +876,9 @@ def describe_execute_defer_directive():
 
     @pytest.mark.asyncio()
     async def original_execute_function_throws_error_if_deferred_and_not_all_is_sync():
-        document = parse(
-            """
-            query Deferred {
-              hero { name }
-              ... @defer { hero { id } }
-            }
-            """
-        )
+        document = documents["deferred_with_sync_field"]
 
-        root_value = {"hero": {**hero, "name": Resolvers.slow}}
+        root_value = {"hero": hero_with_slow_name}
         with pytest.raises(GraphQLError) as exc_info:
             await execute(schema, document, root_value)  # type: ignore
 